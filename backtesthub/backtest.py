@@ -2,12 +2,14 @@
 
 import pandas as pd
 from numbers import Number
-from uuid import uuid3, NAMESPACE_DNS
-from collections import OrderedDict
+from uuid import UUID
+from hashlib import blake2b
 from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Dict,
     List,
+    Optional,
     Sequence,
     Union,
 )
@@ -88,29 +90,24 @@ class Backtest:
         self.__compensation: float = config.get("compensation", 1)
 
         self.__main: Line = Line(self.__index)
-        self.__bases: Dict[str, Base] = OrderedDict()
-        self.__assets: Dict[str, Asset] = OrderedDict()
-        self.__hedges: Dict[str, Asset] = OrderedDict()
+        self.__bases: Dict[str, Base] = {}
+        self.__assets: Dict[str, Asset] = {}
+        self.__hedges: Dict[str, Asset] = {}
 
-        self.__broker: Broker = Broker(
-            index=self.__index,
-            echo=_DEFAULT_ECHO,
-        )
+        ## Broker, Pipeline(s) and Strategy(ies) are
+        ## only built when needed (see `__build`).
 
-        self.__pipeline: Pipeline = pipeline(
-            main=self.__main,
-            holidays=calendar.holidays,
-            broker=self.__broker,
-            assets=self.__assets,
-        )
+        self.__holidays: Sequence[date] = calendar.holidays
+        self.__pipeline_cls: type = pipeline
+        self.__strategy_cls: type = strategy
+        self.__hconfig: Optional[tuple] = None
+        self.__broker: Optional[Broker] = None
 
-        self.__strategy: Strategy = strategy(
-            broker=self.__broker,
-            pipeline=self.__pipeline,
-            bases=self.__bases,
-            assets=self.__assets,
-            target=self.target
-        )
+        ## Hash/uid and properties are memoized
+        ## (see `config_backtest`).
+
+        self.__hash: Optional[dict] = None
+        self.__properties: Optional[pd.DataFrame] = None
 
     def config_hedge(
         self,
@@ -139,6 +136,54 @@ class Backtest:
             msg = "Arg `pipeline` must be a `Pipeline` subclass!"
             raise TypeError(msg)
 
+        self.__hconfig = (pipeline, strategy)
+
+        if self.__broker is not None:
+            self.__build_hedge()
+
+    def __build(self):
+        """
+        `Build Method`
+
+        Instantiates Broker, Pipeline(s) and Strategy(ies)
+        the first time they are needed (i.e. @ `run`), so
+        that throwaway instances, such as the ones created
+        for cataloguing a parameter grid, don't allocate
+        the broker's per-index arrays.
+        """
+
+        if self.__broker is not None:
+            return
+
+        self.__broker = Broker(
+            index=self.__index,
+            echo=_DEFAULT_ECHO,
+        )
+
+        for base in self.__bases.values():
+            self.__assign_base(base)
+
+        self.__pipeline: Pipeline = self.__pipeline_cls(
+            main=self.__main,
+            holidays=self.__holidays,
+            broker=self.__broker,
+            assets=self.__assets,
+        )
+
+        self.__strategy: Strategy = self.__strategy_cls(
+            broker=self.__broker,
+            pipeline=self.__pipeline,
+            bases=self.__bases,
+            assets=self.__assets,
+            target=self.target
+        )
+
+        if self.__hconfig is not None:
+            self.__build_hedge()
+
+    def __build_hedge(self):
+        pipeline, strategy = self.__hconfig
+
         self.__hpipeline: Pipeline = pipeline(
             main=self.__main,
             broker=self.__broker,
@@ -153,6 +198,16 @@ class Backtest:
             target=self.target,
         )
 
+    def __assign_base(self, base: Base):
+        ticker = base.ticker.upper()
+
+        if ticker in _DEFAULT_PAIRS:
+            self.__broker.add_curr(base)
+        if ticker == _DEFAULT_CARRY:
+            self.__broker.add_carry(base)
+        if ticker == _DEFAULT_MARKET:
+            self.__broker.add_market(base)
+
     def add_base(
         self,
         ticker: str,
@@ -195,12 +250,8 @@ class Backtest:
             {ticker: base},
         )
 
-        if ticker.upper() in _DEFAULT_PAIRS:
-            self.__broker.add_curr(base)
-        if ticker.upper() == _DEFAULT_CARRY:
-            self.__broker.add_carry(base)
-        if ticker.upper() == _DEFAULT_MARKET:
-            self.__broker.add_market(base)
+        if self.__broker is not None:
+            self.__assign_base(base)
 
     def add_asset(
         self,
@@ -302,7 +353,13 @@ class Backtest:
         if not self.__assets:
             return
 
-        self.config_backtest()
+        self.__build()
+
+        self.__stack: Sequence[Union[Base, Asset]] = (
+            *self.__bases.values(),
+            *self.__assets.values(),
+            *self.__hedges.values(),
+        )
 
         self.__pipeline.init()
         self.__strategy.init()
@@ -311,21 +368,37 @@ class Backtest:
             self.__hpipeline.init()
             self.__hstrategy.init()
 
-        while self.dt < self.__lastdate:
-            self.__advance_buffers()
-            self.__broker.beg_of_period()
-            self.__pipeline.next()
-            self.__strategy.next()
-            if self.__hedges:
-                self.__hpipeline.next()
-                self.__hstrategy.next()
-            self.__broker.end_of_period()
-
-            if self.__broker.cum_return < _DEFAULT_MAX_LOSS:
+        ## bound methods are hoisted out of the
+        ## event loop, which is driven by the # of
+        ## remaining periods, i.e. same stop as
+        ## `self.dt < self.__lastdate`.
+
+        advance = self.__advance_buffers
+        beg_of_period = self.__broker.beg_of_period
+        end_of_period = self.__broker.end_of_period
+        pipeline_next = self.__pipeline.next
+        strategy_next = self.__strategy.next
+
+        hedged = bool(self.__hedges)
+        if hedged:
+            hpipeline_next = self.__hpipeline.next
+            hstrategy_next = self.__hstrategy.next
+
+        periods = len(self.__index) - 1 - self.__main.buffer
+
+        for _ in range(periods):
+            advance()
+            beg_of_period()
+            pipeline_next()
+            strategy_next()
+            if hedged:
+                hpipeline_next()
+                hstrategy_next()
+            if end_of_period() < _DEFAULT_MAX_LOSS:
                 break
 
         dct = {
-            "meta": self.__properties,
+            "meta": self.properties,
             "quotas": self.__broker.df,
             "records": self.__broker.rec,
             "broker": self.__broker,
@@ -336,23 +409,61 @@ class Backtest:
 
         return dct
 
+    @staticmethod
+    def run_many(
+        backtests: Sequence["Backtest"],
+        n_workers: Optional[int] = None,
+    ) -> List[Dict[str, pd.DataFrame]]:
+        """
+        `Run Many Backtests`
+
+        Runs a sequence of fully configured backtests
+        (i.e. bases/assets/hedges already added) in a
+        thread pool of `n_workers` threads, and returns
+        their results in the same order.
+
+        It is meant for parameter sweeps, which are
+        embarrassingly parallel: each `Backtest` owns
+        its `Broker`, `Pipeline` and `Strategy`, thus
+        nothing mutable is shared among threads, as
+        long as the same instance isn't passed twice.
+
+        NOTE: Threads only scale on free-threaded (no
+        GIL) python builds, e.g. 3.13t. On standard
+        builds, the event loop is GIL bound, so one is
+        better off using `ProcessPoolExecutor` instead.
+        """
+
+        if len(set(map(id, backtests))) < len(backtests):
+            msg = "Arg `backtests` must not repeat instances"
+            raise ValueError(msg)
+
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(Backtest.run, backtests))
+
     def __advance_buffers(self):
         """
         `Advance Buffer Method`
 
         Advances all line buffers at once,
         guaranteeing synchronized updates.
+
+        Iterates over the data stack cached
+        by `run`, instead of `self.datas`,
+        which rebuilds a dict at each call.
+
+        Each data advances all of its lines
+        through one shared cursor increment.
         """
 
         self.__main.next()
         self.__broker.next()
-        for data in self.datas.values():
+        for data in self.__stack:
             data.next()
 
     def __repr__(self) -> str:
-        if not hasattr(self, "__hash"):
-            self.config_backtest()
-        return self.__hash
+        self.config_backtest()
+        return str(self.__hash)
 
     @property
     def dt(self) -> date:
@@ -386,6 +497,7 @@ class Backtest:
 
     @property
     def strategy(self) -> Strategy:
+        self.__build()
         return self.__strategy
 
     @property
@@ -410,8 +522,30 @@ class Backtest:
 
         Defines the official uid for 
         backtest given input data.
+
+        It is memoized, and only recomputed
+        when strategy params have changed,
+        as all other inputs are fixed at
+        `__init__`.
         """
 
+        ## same lookup before and after build, as
+        ## instance params default to class ones.
+
+        if self.__broker is None:
+            params = getattr(self.__strategy_cls, "params", None)
+        else:
+            params = getattr(self.__strategy, "params", None)
+
+        if not isinstance(params, dict):
+            params = {}
+
+        params = str(dict(params))
+
+        if self.__hash is not None:
+            if self.__hash["params"] == params:
+                return
+
         self.__hash = {
             "factor": self.__factor,
             "market": self.__market,
@@ -420,31 +554,51 @@ class Backtest:
             "base": self.__base,
             "hbase": self.__hbase,
             "vertices": str(self.__vertices),
-            "pipeline": self.__pipeline.__class__.__name__,
-            "model": self.__strategy.__class__.__name__,
-            "params": str(dict(self.__strategy.get_params())),
+            "pipeline": self.__pipeline_cls.__name__,
+            "model": self.__strategy_cls.__name__,
+            "params": params,
         }
 
-        self.__uid = uuid3(
-            NAMESPACE_DNS,
-            str(self.__hash),
+        digest = blake2b(
+            repr(sorted(self.__hash.items())).encode(),
+            digest_size=16,
         )
 
-        self.__properties = pd.DataFrame.from_records(
-            [
-                {
-                    **self.__hash,
-                    "uid": self.__uid.hex,
-                    "sdate": self.__firstdate.isoformat(),
-                    "edate": self.__lastdate.isoformat(),
-                    "updtime": datetime.now().isoformat(),
-                    "budget": _DEFAULT_VOLATILITY,
-                    "buffer": _DEFAULT_BUFFER,
-                    "sizing": _DEFAULT_SIZING,
-                    "thresh": _DEFAULT_THRESH,
-                    "vparam": _DEFAULT_SMOOTH,
-                    "bookname": self.bookname,
-                    "compensation": self.__compensation,
-                }
-            ]
+        self.__uid = UUID(bytes=digest.digest())
+        self.__properties = None
+
+    @property
+    def properties(self) -> pd.DataFrame:
+        """
+        `Backtest Properties`
+
+        Single row `pd.DataFrame` with backtest
+        uid and settings, built on first request,
+        and rebuilt whenever the uid changes.
+        """
+
+        self.config_backtest()
+
+        if self.__properties is not None:
+            return self.__properties
+
+        rec = {
+            **self.__hash,
+            "uid": self.__uid.hex,
+            "sdate": self.__firstdate.isoformat(),
+            "edate": self.__lastdate.isoformat(),
+            "updtime": datetime.now().isoformat(),
+            "budget": _DEFAULT_VOLATILITY,
+            "buffer": _DEFAULT_BUFFER,
+            "sizing": _DEFAULT_SIZING,
+            "thresh": _DEFAULT_THRESH,
+            "vparam": _DEFAULT_SMOOTH,
+            "bookname": self.bookname,
+            "compensation": self.__compensation,
+        }
+
+        self.__properties = pd.DataFrame(
+            {k: [v] for k, v in rec.items()},
         )
+
+        return self.__properties
@@ -349,13 +349,18 @@ class Broker:
             )
             print(f"{self.date.isoformat()}, {txt}")
 
-    def end_of_period(self):
+    def end_of_period(self) -> Number:
         """
         `End of period PNL Accounting`
 
         Update curr cash and curr equity
         Consider only closing positions.
 
+        Returns the cumulative return [%] at
+        close, i.e. `self.cum_return`, so that
+        the event loop can check the stop
+        condition without further lookups.
+
         OBS: Since we have already taken into account the
         trading mark-to-market effect of the executed [new]
         positions at the execution stage, we don't need to
@@ -498,6 +503,8 @@ class Broker:
                     }
                 )
 
+        return self.cum_return
+
     def __cancel_order(self, order: Order):
         if order.status == _STATUS["WAIT"]:
             print(f"Order cancelled: {order}")
@@ -0,0 +1,93 @@
+#! /usr/bin/env python3
+
+"""
+`AOT Indicators Build`
+
+Compiles ahead-of-time the numba kernels of `_loops.py`
+into the `_indicators_aot` extension module, placed next
+to this file, so that processes (e.g. parameter sweeps,
+live reruns) don't pay the JIT warmup of each kernel.
+
+It requires numba, and should be run once at install time
+(and again whenever `_loops.py` changes):
+
+    python -m backtesthub.indicators._aot_build
+
+If the extension isn't built, `indicator.py` falls back
+to the `@njit` kernels, or to their pandas counterparts
+when numba isn't installed.
+
+Before compiling, kernels are checked against their pandas
+counterparts on random, flat and constant inputs, as any
+drift would flip cross signals on flat stretches.
+"""
+
+import os
+import numpy as np
+from numba.pycc import CC
+
+from ._loops import (
+    _sma_pair,
+    _sma_cross,
+    _ema_cross,
+    _sma_pair_pd,
+    _sma_cross_pd,
+    _ema_cross_pd,
+)
+
+cc = CC("_indicators_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("sma_pair", "UniTuple(f8[:], 2)(f8[:], i8, i8)")
+def sma_pair(close, p1, p2):
+    return _sma_pair(close, p1, p2)
+
+
+@cc.export("sma_cross", "i1[:](f8[:], i8, i8)")
+def sma_cross(close, p1, p2):
+    return _sma_cross(close, p1, p2)
+
+
+@cc.export("ema_cross", "i1[:](f8[:], i8, i8)")
+def ema_cross(close, p1, p2):
+    return _ema_cross(close, p1, p2)
+
+
+def check():
+    """
+    `Kernels Regression Check`
+
+    Raises AssertionError whenever a kernel doesn't
+    reproduce its pandas counterpart bit for bit.
+    """
+
+    rng = np.random.default_rng(0)
+
+    walk = 100 * np.exp(0.01 * rng.standard_normal(2000).cumsum())
+    flat = walk.round(2)
+    flat[500:700] = flat[499]  ## e.g. forward-filled prices
+    flat[:10] = np.nan
+
+    for close in (np.full(500, 37.13), walk, flat):
+        for p1, p2 in ((10, 100), (1, 5), (50, 20)):
+            for k, pd_k in zip(
+                _sma_pair(close, p1, p2),
+                _sma_pair_pd(close, p1, p2),
+            ):
+                assert np.array_equal(k, pd_k, equal_nan=True)
+
+            assert np.array_equal(
+                _sma_cross(close, p1, p2),
+                _sma_cross_pd(close, p1, p2),
+            )
+
+            assert np.array_equal(
+                _ema_cross(close, p1, p2),
+                _ema_cross_pd(close, p1, p2),
+            )
+
+
+if __name__ == "__main__":
+    check()
+    cc.compile()
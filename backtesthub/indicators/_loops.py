@@ -0,0 +1,226 @@
+#! /usr/bin/env python3
+
+import numpy as np
+import pandas as pd
+
+from ..utils._njit import njit
+
+
+@njit(cache=True)
+def _rolling_mean(
+    close: np.ndarray,
+    p: int,
+) -> np.ndarray:
+    """
+    `Rolling Mean Kernel`
+
+    Mirrors pd.Series.rolling(p).mean() bit for bit:
+    the window sum is updated in O(1) per step, with
+    Kahan-compensated add/remove (separate error terms,
+    as in pandas), and the mean of a window holding a
+    single repeated value is that value, so flat
+    stretches (e.g. forward-filled prices) don't drift.
+
+    Entries are np.nan until the window is complete,
+    and while there's any np.nan inside the window.
+    """
+
+    n = close.shape[0]
+    out = np.empty(n)
+
+    s, c_add, c_rem = 0.0, 0.0, 0.0  ## sum, compensations
+    nobs, neg = 0, 0  ## valid / negative values in window
+    same, prev = 0, np.nan  ## trailing run of equal values
+
+    for i in range(n):
+        if i >= p:
+            y = close[i - p]
+            if not np.isnan(y):
+                nobs -= 1
+                if y < 0:
+                    neg -= 1
+                y = -y - c_rem
+                t = s + y
+                c_rem = t - s - y
+                s = t
+
+        x = close[i]
+        if not np.isnan(x):
+            nobs += 1
+            if x < 0:
+                neg += 1
+            if x == prev:
+                same += 1
+            else:
+                same = 1
+            prev = x
+            y = x - c_add
+            t = s + y
+            c_add = t - s - y
+            s = t
+
+        if nobs >= p:
+            m = s / nobs
+            if same >= nobs:
+                m = prev
+            elif neg == 0 and m < 0:
+                m = 0.0
+            elif neg == nobs and m > 0:
+                m = 0.0
+            out[i] = m
+        else:
+            out[i] = np.nan
+
+    return out
+
+
+@njit(cache=True)
+def _sma_pair(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+):
+    """
+    `SMA Pair Kernel`
+
+    Computes SMA(p1) and SMA(p2) of `close`,
+    in O(N) regardless of p1/p2.
+    """
+
+    return _rolling_mean(close, p1), _rolling_mean(close, p2)
+
+
+@njit(cache=True)
+def _sma_cross(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+) -> np.ndarray:
+    """
+    `SMA Cross Kernel`
+
+    Sign of SMA(p1) - SMA(p2), output as int8,
+    computed by comparisons instead of np.sign.
+
+    Entries are 0 while either SMA is np.nan, i.e.
+    warmup bars are 0 instead of np.nan (as given
+    by np.sign): whenever max(p1, p2) exceeds the
+    buffer, the strategy now stays flat over those
+    bars, where `Strategy.sizing` used to raise.
+    """
+
+    sma1, sma2 = _sma_pair(close, p1, p2)
+
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.int8)
+
+    for i in range(n):
+        a, b = sma1[i], sma2[i]
+        out[i] = int(a > b) - int(a < b)
+
+    return out
+
+
+@njit(cache=True)
+def _ema_cross(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+) -> np.ndarray:
+    """
+    `EMA Cross Kernel`
+
+    Sign of EMA(p1) - EMA(p2), both EMAs updated in
+    the same pass over `close`, output as int8.
+
+    Mirrors pd.Series.ewm(span=p).mean() bit for bit,
+    using pandas' own update, i.e. the EMA moves to
+    (old_wt * ema + x) / (old_wt + 1), where old_wt
+    decays at every bar, and it is left unchanged
+    when x equals it, so flat prices don't drift.
+
+    Entries are 0 while no valid price was observed.
+    """
+
+    n = close.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+
+    d1 = 1.0 - 1.0 / (1.0 + (p1 - 1) / 2.0)
+    d2 = 1.0 - 1.0 / (1.0 + (p2 - 1) / 2.0)
+
+    e1, e2 = np.nan, np.nan
+    w1, w2 = 1.0, 1.0  ## old weights
+
+    for i in range(n):
+        x = close[i]
+
+        if np.isnan(e1):
+            e1, e2 = x, x
+        elif i > 0:
+            w1, w2 = w1 * d1, w2 * d2
+            if not np.isnan(x):
+                if e1 != x:
+                    e1 = (w1 * e1 + x) / (w1 + 1.0)
+                if e2 != x:
+                    e2 = (w2 * e2 + x) / (w2 + 1.0)
+                w1, w2 = w1 + 1.0, w2 + 1.0
+
+        if not np.isnan(e1):
+            out[i] = int(e1 > e2) - int(e1 < e2)
+
+    return out
+
+
+## pandas counterparts of the kernels above, used
+## by `indicator.py` whenever numba isn't available,
+## as interpreted loops would be way slower.
+
+
+def _sma_pair_pd(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+):
+    """
+    `SMA Pair (pandas)`
+    """
+
+    close = pd.Series(close)
+
+    sma1 = close.rolling(p1).mean().to_numpy()
+    sma2 = close.rolling(p2).mean().to_numpy()
+
+    return sma1, sma2
+
+
+def _sma_cross_pd(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+) -> np.ndarray:
+    """
+    `SMA Cross (pandas)`
+
+    Same output as `_sma_cross` (warmup bars are 0).
+    """
+
+    sma1, sma2 = _sma_pair_pd(close, p1, p2)
+
+    return (sma1 > sma2).view(np.int8) - (sma1 < sma2).view(np.int8)
+
+
+def _ema_cross_pd(
+    close: np.ndarray,
+    p1: int,
+    p2: int,
+) -> np.ndarray:
+    """
+    `EMA Cross (pandas)`
+    """
+
+    close = pd.Series(close)
+
+    ema1 = close.ewm(span=p1).mean().to_numpy()
+    ema2 = close.ewm(span=p2).mean().to_numpy()
+
+    return (ema1 > ema2).view(np.int8) - (ema1 < ema2).view(np.int8)
@@ -5,11 +5,31 @@ from workdays import workday
 from holidays import BR, US
 
 from typing import Union
+from ..utils._njit import NUMBA
 from ..utils.bases import (
     Base,
     Asset,
 )
 
+try:
+    from ._indicators_aot import (
+        sma_pair as _sma_pair,
+        sma_cross as _sma_cross,
+        ema_cross as _ema_cross,
+    )
+except ImportError:
+    if NUMBA:
+        from ._loops import (
+            _sma_pair,
+            _sma_cross,
+            _ema_cross,
+        )
+    else:
+        from ._loops import (
+            _sma_pair_pd as _sma_pair,
+            _sma_cross_pd as _sma_cross,
+            _ema_cross_pd as _ema_cross,
+        )
 from .ta import (
     KAMAIndicator as KAMA,
     BollingerBands as BBANDS,
@@ -26,7 +46,7 @@ def Buy_n_Hold(
     """
     Simple Buy-n-Hold Long Strategy
     """
-    return np.ones(len(data))
+    return np.ones(len(data), dtype=np.int8)
 
 
 def Sell_n_Hold(
@@ -34,9 +54,9 @@ def Sell_n_Hold(
     *args,
 ) -> pd.Series:
     """
-    Simple Buy-n-Hold Long Strategy
+    Simple Sell-n-Hold Short Strategy
     """
-    return -np.ones(len(data))
+    return np.full(len(data), -1, dtype=np.int8)
 
 
 def SMACross(
@@ -47,12 +67,15 @@ def SMACross(
 ) -> pd.Series:
     """
     `Simple Moving Average (SMA) Cross`
+
+    Returns an int8 signal, where warmup bars
+    (i.e. SMA(p2) not defined yet) are 0, not
+    np.nan, so no position is taken on those.
     """
 
-    sma1 = pd.Series(data.close).rolling(p1).mean()
-    sma2 = pd.Series(data.close).rolling(p2).mean()
+    close = np.ascontiguousarray(data.close.array, dtype=np.float64)
 
-    return np.sign(sma1 - sma2)
+    return _sma_cross(close, p1, p2)
 
 
 def SMARatio(
@@ -65,8 +88,8 @@ def SMARatio(
     `Simple Moving Average (SMA) Cross`
     """
 
-    sma1 = pd.Series(data.close).rolling(p1).mean()
-    sma2 = pd.Series(data.close).rolling(p2).mean()
+    close = np.ascontiguousarray(data.close.array, dtype=np.float64)
+    sma1, sma2 = _sma_pair(close, p1, p2)
 
     return np.divide(sma1, sma2) - 1
 
@@ -81,10 +104,9 @@ def EMACross(
     `Exponential Moving Average (EMA) Cross`
     """
 
-    ema1 = pd.Series(data.close).ewm(span=p1).mean()
-    ema2 = pd.Series(data.close).ewm(span=p2).mean()
+    close = np.ascontiguousarray(data.close.array, dtype=np.float64)
 
-    return np.sign(ema1 - ema2)
+    return _ema_cross(close, p1, p2)
 
 
 def KAMACross(
@@ -3,6 +3,7 @@
 import math
 import numpy as np
 import pandas as pd
+from threading import Lock
 from numbers import Number
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict, defaultdict as ddict
@@ -17,10 +18,72 @@ from .utils.config import (
     _DEFAULT_CURRENCY,
     _DEFAULT_SIZING,
     _DEFAULT_THRESH,
+    _DEFAULT_IND_CACHE,
     _MIN_VOL,
     _METHOD,
 )
 
+_INDICATORS: Dict[tuple, np.ndarray] = OrderedDict()
+_INDICATORS_LOCK = Lock()
+
+
+def _cached_indicator(
+    func: Callable,
+    data: Union[Base, Asset],
+    args: tuple,
+) -> np.ndarray:
+    """
+    Evaluates `func(data, *args)` as a contiguous array
+    (multi-column results as one row per column).
+
+    Results may be LRU memoized, keyed on (func, args,
+    `data.digest`), holding up to _DEFAULT_IND_CACHE
+    (env DEF_IND_CACHE) results. It is opt-in (default
+    0, i.e. disabled), and only sound for indicators
+    that are pure functions of `data` and `args`, as
+    any other state isn't part of the key.
+
+    The digest is computed once per data object, but
+    it still costs more than the library's own kernels
+    (e.g. SMACross), so it pays off for costlier ones.
+
+    Cached arrays are kept private, and callers always
+    get a writable copy.
+    """
+
+    key = None
+
+    if _DEFAULT_IND_CACHE > 0:
+        try:
+            key = (func, args, data.digest)
+            hash(key)
+        except TypeError:
+            key = None
+
+    if key is not None:
+        with _INDICATORS_LOCK:
+            if key in _INDICATORS:
+                _INDICATORS.move_to_end(key)
+                return _INDICATORS[key].copy()
+
+    ind = func(data, *args)
+
+    if isinstance(ind, pd.DataFrame):
+        ind = ind.to_numpy().T
+
+    ind = np.ascontiguousarray(ind)
+
+    if key is not None:
+        cached = ind.copy()
+        cached.flags.writeable = False
+
+        with _INDICATORS_LOCK:
+            _INDICATORS[key] = cached
+            while len(_INDICATORS) > _DEFAULT_IND_CACHE:
+                _INDICATORS.popitem(last=False)
+
+    return ind
+
 
 class Strategy(metaclass=ABCMeta):
     """
@@ -118,7 +181,7 @@ class Strategy(metaclass=ABCMeta):
         data: Union[Base, Asset],
         func: Callable,
         **kwargs: Number,
-    ) -> pd.Series:
+    ) -> np.ndarray:
         """
         `Indicator Assignment Method`
 
@@ -132,19 +195,27 @@ class Strategy(metaclass=ABCMeta):
 
         The function should then perform calculations
         in a Line of the object and return an array-like
-        result containing only numbers
+        result containing only numbers, preferably an
+        `np.ndarray`, which is handed off as is.
+
+        Multi-column results (e.g. `pd.DataFrame`) are
+        returned as a 2D array, one row per column.
+
+        Results may be memoized across strategies
+        when DEF_IND_CACHE > 0 (see `_cached_indicator`).
         """
 
-        try:
-            ind = func(data, *kwargs.values())
-        except Exception as e:
-            raise Exception(e)
+        ind = _cached_indicator(func, data, tuple(kwargs.values()))
+
+        if ind.ndim not in (1, 2):
+            msg = "Indicator must be either 1D or 2D"
+            raise ValueError(msg)
 
-        if not len(data) == len(ind):
+        if not len(data) == ind.shape[-1]:
             msg = f"Line length not compatible"
             raise ValueError(msg)
 
-        return pd.Series(ind)
+        return ind
 
     def V(
         self,
@@ -158,11 +229,8 @@ class Strategy(metaclass=ABCMeta):
         Basically does the same job as `self.I`
         but it is applied to volatility calcs.
         """
-        
-        try:
-            vol = func(data, *kwargs.values())
-        except Exception as e:
-            raise Exception(e)
+
+        vol = func(data, *kwargs.values())
 
         return pd.Series(vol)
 
@@ -0,0 +1,30 @@
+#! /usr/bin/env python3
+
+"""
+`Optional Numba Support`
+
+Numba is not a hard requirement of backtesthub. Whenever
+it is not installed, `njit` falls back to a no-op decorator,
+so that kernel modules are still importable, and `NUMBA`
+is set to False, so that callers may pick vectorized
+(numpy/pandas) counterparts instead of running kernels
+as interpreted python loops.
+"""
+
+try:
+    from numba import njit
+
+    NUMBA = True
+
+except ImportError:
+
+    NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and not kwargs and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
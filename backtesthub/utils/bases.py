@@ -3,8 +3,9 @@
 import numpy as np
 import pandas as pd
 from datetime import date
+from hashlib import blake2b
 from numbers import Number
-from typing import Optional, Sequence, Union
+from typing import List, Optional, Sequence, Union
 
 from .checks import derive_asset
 from .config import (
@@ -67,6 +68,10 @@ class Line(np.ndarray):
     main function, in order to maintain synchonism at all lines held by 
     every data object.
 
+    The buffer is held by a one-item `cursor` list, which can be shared
+    among lines through `self.bind()`, so that advancing the cursor
+    once advances all lines bound to it.
+
     """
 
     def __new__(
@@ -79,25 +84,28 @@ class Line(np.ndarray):
         obj = arr.view(cls)
         obj.__array = arr
         obj.__len = len(arr)
-        obj.__buffer = buffer
+        obj.__cursor = [buffer]
 
         return obj
 
     def __getitem__(self, key: int):
-        key += self.__buffer
+        key += self.__cursor[0]
         return super().__getitem__(key)
 
     def __repr__(self):
         beg = _DEFAULT_BUFFER
-        end = self.__buffer
+        end = self.buffer
         return repr(self.__array[beg: end + 1])
 
     def next(self):
-        self.__buffer += 1
+        self.__cursor[0] += 1
+
+    def bind(self, cursor: List[int]):
+        self.__cursor = cursor
 
     @property
     def buffer(self) -> int:
-        return self.__buffer
+        return self.__cursor[0]
 
     @property
     def array(self) -> Sequence:
@@ -190,11 +198,15 @@ class Data:
 
         self.__lines = {l.lower(): Line(arr) for l, arr in data.items()}
         self.__lines["__index"] = Line(array=index)
-        self.__buffer = _DEFAULT_BUFFER
         self.__df = data
+        self.__digest = None
+
+        self.__cursor = [_DEFAULT_BUFFER]
+        for line in self.__lines.values():
+            line.bind(self.__cursor)
 
     def __repr__(self):
-        dct = {k: v for k, v in self.__df.iloc[self.__buffer].items()}
+        dct = {k: v for k, v in self.__df.iloc[self.buffer].items()}
         lines = ", ".join("{}={:.2f}".format(k, v) for k, v in dct.items())
 
         return f"<{self.__class__.__name__} {self.ticker} ({self.date}) {lines}>"
@@ -209,9 +221,7 @@ class Data:
         return len(self.__df)
 
     def next(self):
-        self.__buffer += 1
-        for line in self.__lines:
-            self.__lines[line].next()
+        self.__cursor[0] += 1
 
     def add_line(self, name: str, line: Line):
         if not isinstance(line, Line):
@@ -222,10 +232,14 @@ class Data:
             msg = "Line must be of same length of Data"
             raise ValueError(msg)
 
+        line.bind(self.__cursor)
+
         self.__lines.update(
             {name: line},
         )
 
+        self.__digest = None
+
     @property
     def index(self) -> Line:
         return self.__lines["__index"]
@@ -244,13 +258,44 @@ class Data:
 
     @property
     def buffer(self) -> int:
-        return self.__buffer
+        return self.__cursor[0]
 
     @property
     def lines(self) -> Sequence[str]:
         lines = self.__lines.keys()
         return tuple(l for l in lines if not l.startswith("__"))
 
+    @property
+    def digest(self) -> bytes:
+        """
+        `Data Digest`
+
+        Digest of ticker, maturity, index and all numeric
+        lines' contents, so that only identical histories
+        share it (e.g. indicators memoization key).
+
+        It is computed once, on first request, and reset
+        by `self.add_line`.
+        """
+
+        if self.__digest is None:
+            digest = blake2b(digest_size=16)
+
+            maturity = getattr(self, "maturity", None)
+            digest.update(repr((self.ticker, maturity)).encode())
+            digest.update(pd.DatetimeIndex(self.index.array).asi8.tobytes())
+
+            for name in self.lines:
+                arr = self.__lines[name].array
+                if arr.dtype.kind not in "biuf":
+                    continue
+                digest.update(name.encode())
+                digest.update(np.ascontiguousarray(arr).tobytes())
+
+            self.__digest = digest.digest()
+
+        return self.__digest
+
 
 class Base(Data):
 
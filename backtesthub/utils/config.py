@@ -35,6 +35,7 @@ _DEFAULT_MAX_LOSS: float = float(os.getenv("DEF_MAX_LOSS", "-99"))
 _DEFAULT_MARKET: str = os.getenv("DEF_MARKET", "IBOV")
 _DEFAULT_COUNTRY: str = os.getenv("DEF_COUNTRY", "BR")
 _DEFAULT_N: int = int(os.getenv("DEF_N", "30"))
+_DEFAULT_IND_CACHE: int = int(os.getenv("DEF_IND_CACHE", "0"))
 _DEFAULT_URL = {
     "drivername": str(os.getenv("DB_DRIVER", "")),
     "username": str(os.getenv("DB_USER", "")),
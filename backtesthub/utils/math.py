@@ -233,30 +233,48 @@ def fill_OHLC(df: pd.DataFrame) -> pd.DataFrame:
     are the ones we might have more certain about
     their validity), we'll be able to input a 
     consistent price df for the `Broker`.  
+
+    The filling itself is carried out on float64
+    arrays by `fill_OHLC_arrays`, and a new df is
+    returned, i.e. `df` is left untouched.
     """
 
     if "close" not in df.columns:
         txt = "df must have at least CLOSE as column"
         raise ValueError(txt)
 
-    if "open" in df.columns:
-        df.loc[df.open.isna(), "open"] = df.loc[df.open.isna(), "close"]
-    else:
-        df["open"] = df["close"]
+    close = df["close"].to_numpy(dtype=np.float64)
 
-    if "high" in df.columns:
-        df.loc[df.high.isna(), "high"] = df.loc[df.high.isna(), ["open", "close"]].max(
-            axis=1
-        )
-    else:
-        df["high"] = df[["open", "close"]].max(axis=1)
+    ohl = {
+        col: df[col].to_numpy(dtype=np.float64, copy=True)
+        if col in df.columns
+        else np.full(len(close), np.nan)
+        for col in ("open", "high", "low")
+    }
 
-    if "low" in df.columns:
-        df.loc[df.low.isna(), "low"] = df.loc[df.low.isna(), ["open", "close"]].min(
-            axis=1
-        )
+    fill_OHLC_arrays(**ohl, close=close)
 
-    else:
-        df["low"] = df[["open", "close"]].min(axis=1)
+    return df.assign(**ohl)
+
+
+def fill_OHLC_arrays(
+    open: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+):
+    """
+    `Fill OHLC Arrays Function`
+
+    Array counterpart of `fill_OHLC`, which fills
+    np.nan entries of float64 `open`, `high` and
+    `low` arrays in-place:
+
+    O = close, if O is missing
+    H = max(open, close), if H is missing
+    L = min(open, close), if L is missing
+    """
 
-    return df
+    np.copyto(open, close, where=np.isnan(open))
+    np.copyto(high, np.fmax(open, close), where=np.isnan(high))
+    np.copyto(low, np.fmin(open, close), where=np.isnan(low))